@@ -1,11 +1,15 @@
 """Enumerate undirected graphs based on a given set of node colors / types."""
 
 from typing import Iterator
+import hashlib
 import logging
+import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from itertools import combinations_with_replacement
+from itertools import combinations_with_replacement, islice
 import numpy as np
-import networkx as nx
 
 from .graph import Graph
 from graph_enumeration import EdgeGenerator
@@ -13,73 +17,178 @@ from graph_enumeration import EdgeGenerator
 logger = logging.getLogger(__name__)
 
 
+def _edge_index_dtype(max_nodes: int) -> np.dtype:
+    """
+    Get the smallest integer type that can hold the node indices of graphs with up to
+    max_nodes nodes.
+    :param max_nodes: Maximum number of nodes per graph.
+    :return: int8, int16 or int32.
+    """
+    if max_nodes <= np.iinfo(np.int8).max + 1:
+        return np.dtype(np.int8)
+    if max_nodes <= np.iinfo(np.int16).max + 1:
+        return np.dtype(np.int16)
+    return np.dtype(np.int32)
+
+
+def _flatten_edge_configurations(
+    edge_configurations: list[list[tuple[int, int]]], dtype: np.dtype
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Flatten edge configurations into a single array of edge indices and cumulative offsets.
+    Configuration i is stored in flat[offsets[i]:offsets[i + 1]].
+    :param edge_configurations: List of edge configurations.
+    :param dtype: Integer type of the flat array.
+    :return: Tuple of the flat array and the int64 offset array of length N + 1.
+    """
+    # Calculate offsets from the number of edges per configuration
+    lengths = np.fromiter(
+        (len(config) for config in edge_configurations),
+        dtype=np.int64,
+        count=len(edge_configurations),
+    )
+    offsets = np.empty(len(edge_configurations) + 1, dtype=np.int64)
+    offsets[0] = 0
+    np.cumsum(2 * lengths, out=offsets[1:])
+    # Flatten edge configurations (one bulk copy per configuration)
+    flat = np.concatenate(
+        [np.asarray(config, dtype=dtype).ravel() for config in edge_configurations]
+        or [np.empty(0, dtype=dtype)]
+    )
+    return flat, offsets
+
+
+def _split_edge_configurations(
+    flat: np.ndarray, offsets: np.ndarray, index_list: list[int] | None = None
+) -> Iterator[np.ndarray]:
+    """
+    Split a flat array of edge indices back into edge configurations.
+    :param flat: Flat array of edge indices.
+    :param offsets: Cumulative offsets of the configurations in the flat array.
+    :param index_list: Optional list to map edge indices back to original node indices.
+    :return: Iterator over edge configurations, each a view into a single int32 array.
+    """
+    # Map back to original indices if provided. Both branches produce the only int32 copy
+    # of the flat array, which is then viewed as tuples and split without further copies.
+    if index_list is not None:
+        flat = np.take(np.asarray(index_list, dtype=np.int32), flat)
+    else:
+        flat = flat.astype(np.int32)
+    # Split the flat array into tuples
+    tuples = flat.reshape(-1, 2)
+    # Yield edge configurations (offsets in units of edges)
+    edge_offsets = (offsets // 2).tolist()
+    for start, end in zip(edge_offsets[:-1], edge_offsets[1:]):
+        yield tuples[start:end]
+
+
+def _select_edge_configurations(
+    flat: np.ndarray, offsets: np.ndarray, mask: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Select edge configurations from a flat array with a boolean mask in a single pass.
+    :param flat: Flat array of edge indices.
+    :param offsets: Cumulative offsets of the configurations in the flat array.
+    :param mask: Boolean array with one entry per configuration, True to keep it.
+    :return: Tuple of the flat array and the cumulative offsets of the kept configurations.
+    """
+    lengths = np.diff(offsets)
+    flat = flat[np.repeat(mask, lengths)]
+    offsets = np.empty(np.count_nonzero(mask) + 1, dtype=np.int64)
+    offsets[0] = 0
+    np.cumsum(lengths[mask], out=offsets[1:])
+    return flat, offsets
+
+
 class EdgeConfigurationFileCache:
     """
     Class for handling edge configuration file caching.
     The difficulty of different vector lengths per sparse edge configuration is handled by storing
-    all edge configurations in a single flat binary file, along with an offset file tha indicates
-    the start and end positions of each configuration in the flat file.
+    all edge configurations in a single flat .npy file, along with a length file that contains
+    the number of edges of each configuration. The cumulative offsets of the configurations in
+    the flat file are reconstructed from the lengths when loading.
+    To reduce I/O, edge indices and lengths are stored with the smallest integer types that fit
+    the maximum number of nodes (recorded in the .npy headers).
+    The flat file is memory-mapped on first load and kept open together with the offsets, so
+    repeated loads of the same configurations only copy from the page cache.
     """
 
-    def __init__(self, cache_path: str | Path, file_basename: str):
+    def __init__(self, cache_path: str | Path, file_basename: str, max_nodes: int = 11):
         """
         Initialize an EdgeConfigurationCache instance.
         :param cache_path: Path to the directory where cache files are stored.
         :param file_basename: Base name for the cache files.
+        :param max_nodes: Maximum number of nodes per graph. Determines the integer types of the
+            stored edge indices and configuration lengths.
         """
+        self.edge_dtype = _edge_index_dtype(max_nodes)
+        # A configuration has at most one edge per node pair
+        max_edges = max_nodes * (max_nodes - 1) // 2
+        if max_edges <= np.iinfo(np.uint8).max:
+            self.length_dtype = np.dtype(np.uint8)
+        elif max_edges <= np.iinfo(np.uint16).max:
+            self.length_dtype = np.dtype(np.uint16)
+        else:
+            self.length_dtype = np.dtype(np.uint32)
         Path(cache_path).mkdir(parents=True, exist_ok=True)
-        self.cache_path_flat = Path(cache_path) / f"{file_basename}.flat.bin"
-        self.cache_path_offset = Path(cache_path) / f"{file_basename}.offset.bin"
+        self.cache_path_flat = Path(cache_path) / f"{file_basename}.flat.npy"
+        self.cache_path_lengths = Path(cache_path) / f"{file_basename}.lengths.npy"
+        self._arrays = None
 
     def exists(self) -> bool:
         """Check if both cache files exist."""
-        return self.cache_path_flat.exists() and self.cache_path_offset.exists()
+        return self.cache_path_flat.exists() and self.cache_path_lengths.exists()
+
+    def _open(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Memory-map the flat file (read-only) and reconstruct the offsets from the length file,
+        or return the already opened arrays.
+        :return: Tuple of the flat edge index array and the cumulative offset array.
+        """
+        if self._arrays is None:
+            flat = np.load(self.cache_path_flat, mmap_mode="r")
+            lengths = np.load(self.cache_path_lengths)
+            offsets = np.empty(lengths.size + 1, dtype=np.int64)
+            offsets[0] = 0
+            np.cumsum(2 * lengths.astype(np.int64), out=offsets[1:])
+            self._arrays = (flat, offsets)
+        return self._arrays
 
     def save(self, edge_configurations: list[list[tuple[int, int]]]):
         """
         Save edge configurations to cache files.
         :param edge_configurations: List of edge configurations to save to the cache files.
         """
-        # Flatten edge configurations for storage
-        flat = np.array(
-            [x for config in edge_configurations for edge in config for x in edge],
-            dtype=np.int32,
+        self.save_flat(
+            *_flatten_edge_configurations(edge_configurations, self.edge_dtype)
+        )
+
+    def save_flat(self, flat: np.ndarray, offsets: np.ndarray):
+        """
+        Save edge configurations that are already flattened to cache files.
+        :param flat: Flat array of edge indices.
+        :param offsets: Cumulative offsets of the configurations in the flat array.
+        """
+        # Save to .npy files
+        self._arrays = None
+        np.save(self.cache_path_flat, flat.astype(self.edge_dtype, copy=False))
+        np.save(
+            self.cache_path_lengths, (np.diff(offsets) // 2).astype(self.length_dtype)
         )
-        # Calculate offsets
-        offsets = np.zeros((len(edge_configurations), 2), dtype=np.int64)
-        idx = 0
-        for i, config in enumerate(edge_configurations):
-            offsets[i] = (idx, idx + 2 * len(config))
-            idx += 2 * len(config)
-        # Save to binary files
-        flat.tofile(self.cache_path_flat)
-        offsets.tofile(self.cache_path_offset)
 
     def load_all(
         self,
         index_list: list[int] | None = None,
-    ) -> list[np.ndarray]:
+    ) -> Iterator[np.ndarray]:
         """
-        Load all edge configurations from cache files.
+        Load all edge configurations from cache files. The configurations are yielded lazily as
+        views into a single array.
         :param index_list: Optional list to map edge indices back to original node indices.
-        :return: List of edge configurations.
+        :return: Iterator over edge configurations.
         """
         # Load from binary files
-        flat = np.fromfile(self.cache_path_flat, dtype=np.int32)
-        offsets = np.fromfile(self.cache_path_offset, dtype=np.int64).reshape(-1, 2)
-        # Split the flat array into tuples
-        tuples = flat.reshape(-1, 2)
-        # Map back to original indices if provided
-        if index_list is not None:
-            index_list = np.array(index_list, dtype=np.int32)
-            tuples = index_list[tuples]
-        # Compute lengths of each sublist
-        lengths = (offsets[:, 1] - offsets[:, 0]) // 2
-        # Calculate split indices
-        split_points = np.cumsum(lengths)[:-1]
-        # Split into edge configurations
-        edge_configurations = np.split(tuples, split_points)
-        return edge_configurations
+        flat, offsets = self._open()
+        yield from _split_edge_configurations(flat, offsets, index_list)
 
     def load_random(
         self, n: int | float, index_list: list[int] | None = None
@@ -92,30 +201,125 @@ class EdgeConfigurationFileCache:
         :return: List of edge configurations.
         """
         # Load from binary files
-        flat = np.memmap(self.cache_path_flat, dtype=np.int32)
-        offsets = np.memmap(self.cache_path_offset, dtype=np.int64).reshape(-1, 2)
-        total_configs = offsets.shape[0]
+        flat, offsets = self._open()
+        total_configs = offsets.shape[0] - 1
         # Determine number of configurations to load
         if 0 < n < 1:
             n = max(int(total_configs * n), 1)
         if n < 1 or int(n) != n:
             raise ValueError("Invalid number of configurations to load.")
         n = int(min(n, total_configs))
-        # Randomly select indices
+        if n == 0:
+            return []
+        # Randomly select indices and read them in sorted order to scan the memory map front
+        # to back
         selected_indices = np.random.choice(total_configs, size=n, replace=False)
+        order = np.argsort(selected_indices)
+        sorted_indices = selected_indices[order]
+        starts = offsets[sorted_indices]
+        ends = offsets[sorted_indices + 1]
+        # Gather all selected configurations from the flat file in a single pass
+        tuples = np.concatenate(
+            [flat[start:end] for start, end in zip(starts.tolist(), ends.tolist())]
+        ).reshape(-1, 2)
+        # Map back to original indices if provided
         if index_list is not None:
             index_list = np.array(index_list, dtype=np.int32)
-        edge_configurations = []
-        for idx in selected_indices:
-            start, end = offsets[idx]
-            tuples = flat[start:end].reshape(-1, 2)
-            # Map back to original indices if provided
-            if index_list is not None:
-                tuples = index_list[tuples]
-            edge_configurations.append(np.array(tuples))
+            tuples = index_list[tuples]
+        else:
+            tuples = tuples.astype(np.int32)
+        # Split into edge configurations
+        split_points = np.cumsum((ends - starts) // 2)[:-1]
+        sorted_configurations = np.split(tuples, split_points)
+        # Restore the random order of the selection
+        edge_configurations = [None] * n
+        for position, edge_configuration in zip(order.tolist(), sorted_configurations):
+            edge_configurations[position] = edge_configuration
         return edge_configurations
 
 
+def _max_cycle_basis_length(
+    edge_config: list[tuple[int, int]], stop_above: int | None = None
+) -> int:
+    """
+    Get the length of the largest cycle in the cycle basis of a graph given by its edges. This
+    follows the spanning tree traversal of networkx.cycle_basis (same node and neighbor order)
+    but works on plain lists and only tracks cycle lengths instead of building a NetworkX graph.
+    :param edge_config: List of edge tuples.
+    :param stop_above: Optional cycle length. The traversal stops as soon as a longer cycle is
+        found and returns the length found so far.
+    :return: Length of the largest basis cycle or 0 if the graph is acyclic.
+    """
+    adjacency = {}
+    for a, b in edge_config:
+        adjacency.setdefault(a, []).append(b)
+        adjacency.setdefault(b, []).append(a)
+    max_cycle = 0
+    unvisited = dict.fromkeys(adjacency)
+    while unvisited:  # loop over connected components
+        root = unvisited.popitem()[0]
+        stack = [root]
+        pred = {root: root}
+        used = {root: set()}
+        while stack:  # walk the spanning tree finding cycles
+            z = stack.pop()
+            z_used = used[z]
+            for nbr in adjacency[z]:
+                if nbr not in used:
+                    pred[nbr] = z
+                    stack.append(nbr)
+                    used[nbr] = {z}
+                elif nbr not in z_used:
+                    # Follow the tree from z back to a node adjacent to nbr
+                    nbr_used = used[nbr]
+                    cycle_length = 3
+                    p = pred[z]
+                    while p not in nbr_used:
+                        cycle_length += 1
+                        p = pred[p]
+                    if stop_above is not None and cycle_length > stop_above:
+                        return cycle_length
+                    max_cycle = max(max_cycle, cycle_length)
+                    nbr_used.add(z)
+        for node in pred:
+            unvisited.pop(node, None)
+    return max_cycle
+
+
+@lru_cache(maxsize=None)
+def _file_cache_basename(basename_part: str, canonical_rep: tuple[int]) -> str:
+    """
+    Get the base name of the cache files for a canonical representation. Long representations
+    are replaced by a short hash to keep file names bounded.
+    :param basename_part: Part of the base name describing the generator settings.
+    :param canonical_rep: Canonical representation of the node types.
+    :return: Base name for the cache files.
+    """
+    representation = "-".join(map(str, canonical_rep))
+    if len(representation) > 32:
+        representation = hashlib.blake2b(
+            bytes(canonical_rep), digest_size=8
+        ).hexdigest()
+    return f"{basename_part}B{representation}"
+
+
+@lru_cache(maxsize=None)
+def _canonical_representation_from_multiplicities(
+    multiplicities: tuple[int, ...],
+) -> tuple[int, ...]:
+    """
+    Get the canonical representation for node colors with the given multiplicities. The
+    canonical representation only depends on how often each color occurs, so it is cached.
+    :param multiplicities: Number of nodes per color, sorted in descending order.
+    :return: Canonical representation, e.g. (0, 0, 1) for multiplicities (2, 1).
+    """
+    return tuple(
+        canonical_idx
+        for canonical_idx, multiplicity in enumerate(multiplicities)
+        for _ in range(multiplicity)
+    )
+
+
 class GraphGenerator:
     """Class to enumerate undirected graphs based on a given set of node colors / types."""
 
@@ -139,9 +343,10 @@ class GraphGenerator:
         :param min_degree: Minimum degree of any node. Defaults to 1.
         :param min_nodes: Minimum number of nodes. Defaults to max_nodes.
         :param max_cycle_size: Maximum size of cycles allowed in the graph. None for no limit.
-        :param use_memory_cache: Whether to cache results in memory.
+        :param use_memory_cache: Whether to cache results in memory. If the file cache is
+            enabled, only the memory-mapped cache files are kept open instead.
         :param file_cache_path: Path to directory for file-based caching. None to disable file
-            cache. Only used for graphs with more than 5 nodes.
+            cache.
         """
         self.nodes = nodes
         self.max_nodes = max_nodes
@@ -158,8 +363,17 @@ class GraphGenerator:
         self.basename_part = f"D{self.min_degree}-{self.max_degree}" + (
             f"C{self.max_cycle_size}" if self.max_cycle_size is not None else ""
         )
-        self.memory_cache_size_limit = 5 if self.use_file_cache else np.inf
         self.memory_cache = {}
+        # With a single node type, every node list is already in canonical form
+        self._single_color = len(set(nodes)) == 1
+        # Small integer codes per node type (equal node types share a code). None if all node
+        # types are distinct, since the codes are then simply the positions in nodes.
+        type_codes = {node: code for code, node in enumerate(dict.fromkeys(nodes))}
+        self._node_codes = (
+            None
+            if len(type_codes) == len(nodes)
+            else [type_codes[node] for node in nodes]
+        )
 
     @staticmethod
     def _get_canonical_representation(
@@ -179,15 +393,12 @@ class GraphGenerator:
                 node_to_index[node] = [idx]
             else:
                 node_to_index[node].append(idx)
-        node_to_index = sorted(
-            node_to_index.items(), key=lambda x: len(x[1]), reverse=True
+        groups = sorted(node_to_index.values(), key=len, reverse=True)
+        canonical_representation = _canonical_representation_from_multiplicities(
+            tuple(len(indices) for indices in groups)
         )
-        canonical_representation = []
-        index_list = []
-        for canonical_idx, (_, indices) in enumerate(node_to_index):
-            canonical_representation += [canonical_idx] * len(indices)
-            index_list += indices
-        return tuple(canonical_representation), index_list
+        index_list = [idx for indices in groups for idx in indices]
+        return canonical_representation, index_list
 
     def _has_large_cycles(self, edge_config: list[tuple[int, int]]) -> bool:
         """
@@ -195,69 +406,228 @@ class GraphGenerator:
         :param edge_config: List of edge tuples.
         :return: True if there are large cycles, False otherwise.
         """
-        graph = nx.from_edgelist(edge_config)
-        cycles = nx.cycle_basis(graph)
-        max_cycle = max((len(cycle) for cycle in cycles), default=0)
+        max_cycle = _max_cycle_basis_length(edge_config, stop_above=self.max_cycle_size)
         return max_cycle > (self.max_cycle_size or max_cycle)
 
-    def get_all_edge_configurations(self, node_types: list[str]) -> list[np.ndarray]:
+    def _generate_edge_configurations(
+        self, canonical_rep: tuple[int]
+    ) -> tuple[np.ndarray, np.ndarray]:
         """
-        Get all unique edge configurations for the given node types.
+        Generate all unique edge configurations for a canonical representation and apply the
+        cycle size filter.
+        :param canonical_rep: Canonical representation of the node types.
+        :return: Tuple of the flat array of edge indices and the cumulative offsets of the
+            unique edge configurations.
+        """
+        edge_configurations = EdgeGenerator.generate(
+            canonical_rep, max_degree=self.max_degree, min_degree=self.min_degree
+        )
+        flat, offsets = _flatten_edge_configurations(
+            edge_configurations, _edge_index_dtype(self.max_nodes)
+        )
+        # Filter out configurations with large cycles (not possible if there are no more nodes
+        # than the maximum cycle size). The filter is evaluated in one pass into a keep mask,
+        # which then selects the configurations from the flat array at once.
+        if self.max_cycle_size is not None and len(canonical_rep) > self.max_cycle_size:
+            keep = np.fromiter(
+                (not self._has_large_cycles(config) for config in edge_configurations),
+                dtype=bool,
+                count=len(edge_configurations),
+            )
+            flat, offsets = _select_edge_configurations(flat, offsets, keep)
+        return flat, offsets
+
+    def _canonicalize(
+        self, node_types: list[str | int]
+    ) -> tuple[tuple[int], list[int] | None]:
+        """
+        Get the canonical representation and index list of the given node types.
         :param node_types: List of node types.
-        :return: List of unique edge configurations.
-        """
-        # Get canonical representation
-        canonical_rep, index_list = self._get_canonical_representation(node_types)
-        # Use memory caching for small systems
-        if (
-            self.use_memory_cache
-            and len(node_types) <= self.memory_cache_size_limit
-            and canonical_rep in self.memory_cache
-        ):
-            edge_configurations = self.memory_cache[canonical_rep]
-        else:
-            # Use file caching if applicable
-            if self.use_file_cache and len(node_types) > 5:
-                basename = f"{self.basename_part}B{'-'.join(map(str, canonical_rep))}"
-                edge_file_cache = EdgeConfigurationFileCache(
-                    self.file_cache_path, basename
-                )
-                if edge_file_cache.exists():
-                    return edge_file_cache.load_all(index_list=index_list)
-            # If not cached, generate edge configurations
-            edge_configurations = EdgeGenerator.generate(
-                canonical_rep, max_degree=self.max_degree, min_degree=self.min_degree
+        :return: Tuple of the canonical representation and the index list. The index list is
+            None if no mapping is needed (single node type).
+        """
+        if self._single_color:
+            return (0,) * len(node_types), None
+        return self._get_canonical_representation(node_types)
+
+    def _get_file_cache(self, canonical_rep: tuple[int]) -> EdgeConfigurationFileCache:
+        """
+        Get the file cache for a canonical representation. Opened file caches are kept in the
+        memory cache if enabled.
+        :param canonical_rep: Canonical representation of the node types.
+        :return: File cache instance (the cache files may not exist yet).
+        """
+        edge_file_cache = self.memory_cache.get(canonical_rep)
+        if edge_file_cache is None:
+            edge_file_cache = EdgeConfigurationFileCache(
+                self.file_cache_path,
+                _file_cache_basename(self.basename_part, canonical_rep),
+                max_nodes=self.max_nodes,
             )
-            # Filter out configurations with large cycles
-            if self.max_cycle_size is not None:
-                edge_configurations = [
-                    config
-                    for config in edge_configurations
-                    if not self._has_large_cycles(config)
-                ]
-            # Save to memory cache if applicable
-            if (
-                self.use_memory_cache
-                and len(node_types) <= self.memory_cache_size_limit
+            if self.use_memory_cache:
+                self.memory_cache[canonical_rep] = edge_file_cache
+        return edge_file_cache
+
+    def _is_cached(self, canonical_rep: tuple[int]) -> bool:
+        """
+        Check if the edge configurations of a canonical representation are cached.
+        :param canonical_rep: Canonical representation of the node types.
+        :return: True if the edge configurations are in the file or memory cache.
+        """
+        if self.use_file_cache:
+            return self._get_file_cache(canonical_rep).exists()
+        return self.use_memory_cache and canonical_rep in self.memory_cache
+
+    def _load_edge_configurations(
+        self,
+        canonical_rep: tuple[int],
+        index_list: list[int] | None,
+        edge_configurations: tuple[np.ndarray, np.ndarray] | None = None,
+    ) -> Iterator[np.ndarray]:
+        """
+        Get all unique edge configurations for a canonical representation from the cache and
+        map them back to the original node indices. Configurations that are not cached are
+        generated (or taken from the given edge configurations) and added to the cache.
+        :param canonical_rep: Canonical representation of the node types.
+        :param index_list: List to map edge indices back to original node indices or None.
+        :param edge_configurations: Optional already generated flat array and offsets of the
+            edge configurations of the canonical representation, e.g. from a worker process.
+        :return: Iterator over unique edge configurations.
+        """
+        # With file caching, all configurations are read from the (memory-mapped) cache files
+        # and the memory cache only keeps the opened file caches
+        if self.use_file_cache:
+            edge_file_cache = self._get_file_cache(canonical_rep)
+            if not edge_file_cache.exists():
+                if edge_configurations is None:
+                    edge_configurations = self._generate_edge_configurations(
+                        canonical_rep
+                    )
+                edge_file_cache.save_flat(*edge_configurations)
+            return edge_file_cache.load_all(index_list=index_list)
+        # Otherwise, use memory caching if applicable. The memory cache uses the same flat
+        # layout as the file cache instead of lists of edge tuples.
+        if self.use_memory_cache and canonical_rep in self.memory_cache:
+            flat, offsets = self.memory_cache[canonical_rep]
+        else:
+            if edge_configurations is None:
+                edge_configurations = self._generate_edge_configurations(canonical_rep)
+            flat, offsets = edge_configurations
+            if self.use_memory_cache:
+                self.memory_cache[canonical_rep] = (flat, offsets)
+        return _split_edge_configurations(flat, offsets, index_list)
+
+    def get_all_edge_configurations(
+        self, node_types: list[str]
+    ) -> Iterator[np.ndarray]:
+        """
+        Get all unique edge configurations for the given node types.
+        :param node_types: List of node types.
+        :return: Iterator over unique edge configurations.
+        """
+        canonical_rep, index_list = self._canonicalize(node_types)
+        return self._load_edge_configurations(canonical_rep, index_list)
+
+    def _node_lists(self) -> Iterator[tuple[tuple[str | int], tuple[int]]]:
+        """
+        Iterate over all node lists (multisets of node types) to enumerate.
+        :return: Iterator over tuples of node labels and corresponding integer node codes.
+        """
+        for n_nodes in range(self.min_nodes, self.max_nodes + 1):
+            for positions in combinations_with_replacement(
+                range(len(self.nodes)), n_nodes
             ):
-                self.memory_cache[canonical_rep] = edge_configurations
-            # Save to file cache if applicable
-            if self.use_file_cache and len(node_types) > 5:
-                edge_file_cache.save(edge_configurations)
-        # Map back to original node indices
-        edge_configurations = [
-            np.array([(index_list[edge[0]], index_list[edge[1]]) for edge in config])
-            for config in edge_configurations
-        ]
-        return edge_configurations
+                node_list = tuple(self.nodes[pos] for pos in positions)
+                if self._node_codes is None:
+                    yield node_list, positions
+                else:
+                    yield node_list, tuple(self._node_codes[pos] for pos in positions)
+
+    def iter_raw(self) -> Iterator[tuple[tuple[str | int], np.ndarray]]:
+        """
+        Iterator over the raw graph data without creating Graph instances. Useful for pipelines
+        that directly convert the graphs to another format.
+        :return: Iterator over tuples of the node list and the (num_edges, 2) edge array.
+        """
+        for node_list, node_codes in self._node_lists():
+            for edge_configuration in self.get_all_edge_configurations(node_codes):
+                yield node_list, edge_configuration
 
     def iterator(self) -> Iterator[Graph]:
         """
         Graph iterator.
         :return: Iterator over Graph instances.
         """
-        for n_nodes in range(self.min_nodes, self.max_nodes + 1):
-            node_combinations = list(combinations_with_replacement(self.nodes, n_nodes))
-            for node_list in node_combinations:
-                for edge_configuration in self.get_all_edge_configurations(node_list):
+        for node_list, edge_configuration in self.iter_raw():
+            yield Graph(node_list, edge_configuration)
+
+    def parallel_iterator(self, workers: int | None = None) -> Iterator[Graph]:
+        """
+        Graph iterator that generates the edge configurations of all canonical representations
+        which are not cached yet in parallel worker processes. The graphs are yielded in the
+        same order as by `iterator`. The workers are spawned and re-import the `__main__` module,
+        so scripts calling this method must guard the call by `if __name__ == "__main__":`.
+        :param workers: Number of worker processes. Defaults to the number of CPUs.
+        :return: Iterator over Graph instances.
+        """
+        node_lists = [
+            (node_list, *self._canonicalize(node_codes))
+            for node_list, node_codes in self._node_lists()
+        ]
+        # Unique canonical representations (in order of first use) that need to be generated
+        pending = [
+            canonical_rep
+            for canonical_rep in dict.fromkeys(rep for _, rep, _ in node_lists)
+            if not self._is_cached(canonical_rep)
+        ]
+        # Lightweight copy without caches to send to the worker processes
+        worker_generator = GraphGenerator(
+            self.nodes,
+            self.max_nodes,
+            max_degree=self.max_degree,
+            min_degree=self.min_degree,
+            min_nodes=self.min_nodes,
+            max_cycle_size=self.max_cycle_size,
+            use_memory_cache=False,
+        )
+        # Results are kept for later node lists only if no cache retains them
+        keep_results = not self.use_file_cache and not self.use_memory_cache
+        finished = {}
+        # Only about one job per worker is in flight, so that finished results which are not
+        # consumed yet do not pile up in memory
+        window = workers or os.cpu_count() or 1
+        jobs = iter(pending)
+        # Spawn fresh processes, since forking after OpenMP was used may deadlock
+        executor = ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        )
+        try:
+            futures = {
+                canonical_rep: executor.submit(
+                    worker_generator._generate_edge_configurations, canonical_rep
+                )
+                for canonical_rep in islice(jobs, window)
+            }
+            for node_list, canonical_rep, index_list in node_lists:
+                future = futures.pop(canonical_rep, None)
+                if future is not None:
+                    # First use of this representation, submit the next job
+                    for next_rep in islice(jobs, 1):
+                        futures[next_rep] = executor.submit(
+                            worker_generator._generate_edge_configurations, next_rep
+                        )
+                    if keep_results:
+                        finished[canonical_rep] = future
+                else:
+                    future = finished.get(canonical_rep)
+                edge_configurations = self._load_edge_configurations(
+                    canonical_rep,
+                    index_list,
+                    future.result() if future is not None else None,
+                )
+                del future
+                for edge_configuration in edge_configurations:
                     yield Graph(node_list, edge_configuration)
+        finally:
+            # Do not wait for queued jobs if the iterator is closed early
+            executor.shutdown(wait=True, cancel_futures=True)
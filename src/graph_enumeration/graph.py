@@ -7,6 +7,8 @@ import networkx as nx
 class Graph:
     """Class representing a graph with nodes and edges."""
 
+    __slots__ = ("nodes", "edges")
+
     def __init__(self, nodes: list[str | int], edges: np.ndarray):
         """
         Initialize a Graph instance.
@@ -24,10 +26,8 @@ class Graph:
         :return: NetworkX graph representation of the graph.
         """
         graph = nx.Graph()
-        for i, node in enumerate(self.nodes):
-            graph.add_node(i, type=node)
-        for a, b in self.edges:
-            graph.add_edge(a, b)
+        graph.add_nodes_from((i, {"type": node}) for i, node in enumerate(self.nodes))
+        graph.add_edges_from(self.edges.tolist())
         return graph
 
     def __repr__(self) -> str:
@@ -1,4 +1,12 @@
-from graph_enumeration import GraphGenerator
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import networkx as nx
+import graph_enumeration.enumerate as enumerate_module
+from graph_enumeration import GraphGenerator, Graph, EdgeGenerator
+from graph_enumeration.enumerate import (
+    EdgeConfigurationFileCache,
+    _max_cycle_basis_length,
+)
 
 
 def test_canonical_representation():
@@ -28,6 +36,9 @@ def test_simple_graph_generation_count():
     graphs = list(gen.iterator())
     # Expected: Path (1-2-3) and Triangle (1-2-3-1)
     assert len(graphs) == 2
+    raw_graphs = list(gen.iter_raw())
+    assert [nodes for nodes, _ in raw_graphs] == [graph.nodes for graph in graphs]
+    assert sorted(len(edges) for _, edges in raw_graphs) == [2, 3]
 
 
 def test_specific_large_case():
@@ -45,3 +56,121 @@ def test_specific_large_case():
     count = sum(1 for _ in gen.iterator())
     # Number used in this publication: https://doi.org/10.1039/D2SC00116K
     assert count == 124327
+
+
+def test_file_cache(tmp_path):
+    """Test that graphs loaded from the file cache match freshly generated graphs."""
+    kwargs = dict(max_nodes=6, min_nodes=1, max_degree=3)
+    expected = list(GraphGenerator(["A", "B"], **kwargs).iterator())
+    gen = GraphGenerator(["A", "B"], file_cache_path=tmp_path, **kwargs)
+    first_run = list(gen.iterator())
+    gen = GraphGenerator(["A", "B"], file_cache_path=tmp_path, **kwargs)
+    cached_run = list(gen.iterator())
+    assert len(first_run) == len(cached_run) == len(expected)
+    for a, b in zip(expected, cached_run):
+        assert a.nodes == b.nodes
+        assert np.array_equal(a.edges, b.edges)
+
+
+def test_file_cache_load_random(tmp_path):
+    """Test that randomly loaded edge configurations are a subset of all configurations."""
+    cache = EdgeConfigurationFileCache(tmp_path, "test")
+    cache.save(EdgeGenerator.generate((0, 0, 0, 1, 1, 1), max_degree=3, min_degree=1))
+    index_list = [5, 4, 3, 2, 1, 0]
+    all_configs = {
+        tuple(map(tuple, config)) for config in cache.load_all(index_list=index_list)
+    }
+    random_configs = cache.load_random(50, index_list=index_list)
+    assert len(random_configs) == 50
+    assert len({tuple(map(tuple, config)) for config in random_configs}) == 50
+    assert all(tuple(map(tuple, config)) in all_configs for config in random_configs)
+    assert len(cache.load_random(0.5)) == len(all_configs) // 2
+    # Configurations are returned in the order of the random selection
+    configs = [tuple(map(tuple, config)) for config in cache.load_all()]
+    np.random.seed(0)
+    expected = np.random.choice(len(configs), size=20, replace=False)
+    np.random.seed(0)
+    random_configs = cache.load_random(20)
+    assert [tuple(map(tuple, config)) for config in random_configs] == [
+        configs[i] for i in expected
+    ]
+    # Empty cache
+    empty_cache = EdgeConfigurationFileCache(tmp_path, "empty")
+    empty_cache.save([])
+    assert empty_cache.load_random(0.5) == []
+
+
+def test_max_cycle_basis_length():
+    """Test the cycle basis length computation against NetworkX."""
+    for nodes in [(0, 0, 0, 0, 0), (0, 0, 1, 1, 2), (0, 0, 0, 1, 1, 2)]:
+        for edges in EdgeGenerator.generate(nodes, max_degree=4, min_degree=1):
+            cycles = nx.cycle_basis(nx.from_edgelist(edges))
+            expected = max((len(cycle) for cycle in cycles), default=0)
+            assert _max_cycle_basis_length(edges) == expected
+            assert (_max_cycle_basis_length(edges, stop_above=3) > 3) == (expected > 3)
+
+
+def test_parallel_iterator():
+    """Test that the parallel iterator yields the same graphs as the serial iterator."""
+    gen = GraphGenerator(["A", "B", "C"], max_nodes=5, min_nodes=1, max_cycle_size=4)
+    expected = list(gen.iterator())
+    gen = GraphGenerator(["A", "B", "C"], max_nodes=5, min_nodes=1, max_cycle_size=4)
+    graphs = list(gen.parallel_iterator(workers=2))
+    assert len(graphs) == len(expected)
+    for a, b in zip(expected, graphs):
+        assert a.nodes == b.nodes
+        assert np.array_equal(a.edges, b.edges)
+
+
+def test_parallel_iterator_early_exit(monkeypatch):
+    """Test that closing the parallel iterator early does not run all remaining jobs."""
+    futures = []
+
+    class RecordingExecutor(ProcessPoolExecutor):
+        def submit(self, *args, **kwargs):
+            future = super().submit(*args, **kwargs)
+            futures.append(future)
+            return future
+
+    monkeypatch.setattr(enumerate_module, "ProcessPoolExecutor", RecordingExecutor)
+    gen = GraphGenerator(list("ABCDEF"), max_nodes=6, use_memory_cache=False)
+    iterator = gen.parallel_iterator(workers=1)
+    graph = next(iterator)
+    iterator.close()
+    assert isinstance(graph, Graph)
+    # Only the jobs in flight were run, all others were never submitted or cancelled
+    assert all(future.done() for future in futures)
+    assert len([future for future in futures if not future.cancelled()]) <= 2
+    # Graphs are still yielded in full after an early exit
+    gen = GraphGenerator(["A", "B"], max_nodes=3, use_memory_cache=False)
+    for _ in gen.parallel_iterator(workers=1):
+        break
+    assert len(list(gen.parallel_iterator(workers=1))) == len(list(gen.iterator()))
+
+
+def test_to_networkx():
+    """Test the conversion of a graph to a NetworkX graph."""
+    graph = Graph(("A", "B", "A"), np.array([[0, 1], [1, 2]], dtype=np.int32))
+    nx_graph = graph.to_networkx()
+    assert list(nx_graph.nodes(data="type")) == [(0, "A"), (1, "B"), (2, "A")]
+    assert sorted(nx_graph.edges) == [(0, 1), (1, 2)]
+    # Isolated nodes are kept
+    nx_graph = Graph(("A",), np.empty((0, 2), dtype=np.int32)).to_networkx()
+    assert list(nx_graph.nodes(data="type")) == [(0, "A")]
+
+
+def test_max_cycle_size_filter():
+    """Test that the cycle size filter removes the same configurations as NetworkX."""
+    for max_cycle_size in (3, 4, 5):
+        gen = GraphGenerator(
+            [0, 1], max_nodes=6, max_degree=3, max_cycle_size=max_cycle_size
+        )
+        for nodes in [(0, 0, 0, 0, 1, 1), (0, 0, 0, 0, 0, 0)]:
+            expected = [
+                edges
+                for edges in EdgeGenerator.generate(nodes, max_degree=3, min_degree=1)
+                if max(map(len, nx.cycle_basis(nx.from_edgelist(edges))), default=0)
+                <= max_cycle_size
+            ]
+            configs = list(gen.get_all_edge_configurations(nodes))
+            assert [list(map(tuple, edges)) for edges in configs] == expected